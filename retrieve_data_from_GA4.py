@@ -1,15 +1,42 @@
 import pandas as pd
+import numpy as np
 import os
-from collections import defaultdict
+import asyncio
+import binascii
+import hashlib
+import tempfile
+import functools
+from enum import Enum
 from datetime import datetime
-import uuid
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable
 # import backoff
 
+try:
+    # optional: needed for dtype_backend='pyarrow' and Arrow table output
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
 # GA4 package: https://pypi.org/project/google-analytics-data/
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
+from google.analytics.data_v1beta import BetaAnalyticsDataClient, BetaAnalyticsDataAsyncClient
 from google.analytics.data_v1beta.types import DateRange, Dimension, Metric
-from google.analytics.data_v1beta.types import RunReportRequest, BatchRunReportsRequest
+from google.analytics.data_v1beta.types import RunReportRequest, RunReportResponse, MetricHeader, MetricType
+from google.analytics.data_v1beta.types import BatchRunReportsRequest, BatchRunReportsResponse
+from google.analytics.data_v1beta.services.beta_analytics_data.transports import (
+    BetaAnalyticsDataGrpcTransport, BetaAnalyticsDataGrpcAsyncIOTransport)
+
+# gRPC channel options shared by the sync and async clients: keep the connection
+# alive between batches and lift the message size limits for large reports
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    # only added by the transport when it builds its own channel, so required here
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
 
 
 class AuthorizationData:
@@ -21,20 +48,115 @@ class AuthorizationData:
             service_account (str): Path to the service account JSON file.
         """
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = service_account
-        self.client = BetaAnalyticsDataClient()
+        # a single tuned channel, reused by every request made through this client
+        channel = BetaAnalyticsDataGrpcTransport.create_channel(
+            options=GRPC_CHANNEL_OPTIONS)
+        self.client = BetaAnalyticsDataClient(
+            transport=BetaAnalyticsDataGrpcTransport(channel=channel))
+
+
+def create_async_client() -> BetaAnalyticsDataAsyncClient:
+    """
+    Creates an async Analytics Data API client with the tuned gRPC channel options.
+    Must be called inside the event loop that will use the client, and closed with
+    `await client.transport.close()` once that loop is done with it.
+
+    Returns:
+        BetaAnalyticsDataAsyncClient: The async Analytics Data API client.
+    """
+    channel = BetaAnalyticsDataGrpcAsyncIOTransport.create_channel(
+        options=GRPC_CHANNEL_OPTIONS)
+    return BetaAnalyticsDataAsyncClient(
+        transport=BetaAnalyticsDataGrpcAsyncIOTransport(channel=channel))
+
+
+class CacheMode(Enum):
+    """
+    Controls how report responses are read from and written to the on-disk cache.
+    """
+    ENABLED = "enabled"        # read cached responses, call the API and store on miss
+    READ_ONLY = "read-only"    # read cached responses, call the API on miss without storing
+    REPLAY = "replay"          # only read cached responses, never call the API
+    WRITE_ONLY = "write-only"  # always call the API and store the response
+    DISABLED = "disabled"      # always call the API, never touch the cache
+
+
+def cache_response(func):
+    """
+    Caches the reports returned by func on disk, keyed by the SHA256 of the
+    property ID, date range and configuration.
+    """
+    @functools.wraps(func)
+    def wrapper(self, client, property_id: int, config: Dict[str, Any], *args, **kwargs) -> List[RunReportResponse]:
+        if self.cache_mode is CacheMode.DISABLED:
+            return func(self, client, property_id, config, *args, **kwargs)
+
+        key = hashlib.sha256(repr(
+            (property_id, self.start_date, self.end_date, config)).encode()).hexdigest()
+        path = os.path.join(self.cache_dir, f"{key}.pb")
+
+        if self.cache_mode in (CacheMode.ENABLED, CacheMode.READ_ONLY, CacheMode.REPLAY) and os.path.exists(path):
+            with open(path, "rb") as f:
+                return list(BatchRunReportsResponse.deserialize(f.read()).reports)
+        if self.cache_mode is CacheMode.REPLAY:
+            raise FileNotFoundError(
+                f"No cached response for property {property_id} in replay mode: {path}")
+
+        reports = func(self, client, property_id, config, *args, **kwargs)
+        if self.cache_mode in (CacheMode.ENABLED, CacheMode.WRITE_ONLY):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # write to a temp file and move it into place, so an interrupted run
+            # never leaves a truncated cache entry behind
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix=".tmp", delete=False) as f:
+                f.write(BatchRunReportsResponse.serialize(
+                    BatchRunReportsResponse(reports=reports)))
+            os.replace(f.name, path)
+        return reports
+    return wrapper
 
 
 class GetGA4Data():
-    def __init__(self, start_date=None, end_date=None):
+    # Dictionary mapping column names to their desired types
+    column_types = {
+        'activeUsers': 'int64',
+        'active1DayUsers': 'int64',
+        'active7DayUsers': 'int64',
+        'active28DayUsers': 'int64',
+        'userEngagementDuration': 'float64',
+        'engagedSessions': 'int64',
+        'sessions': 'int64',
+        # low-cardinality dimensions
+        'userGender': 'category',
+        'userAgeBracket': 'category'
+    }
+    # GA4 returns at most this many rows per request
+    page_limit = 100000
+    # maximum number of extra pages requested at the same time
+    max_concurrent_pages = 4
+
+    def __init__(self, start_date=None, end_date=None, cache_mode=CacheMode.DISABLED, cache_dir='cache',
+                 dtype_backend=None):
         """
         Initializes the GetGA4Data with optional start and end dates.
 
         Args:
             start_date (str, optional): The start date for the data range. Defaults to '2024-04-01'.
             end_date (str, optional): The end date for the data range. Defaults to '2024-04-30'.
+            cache_mode (CacheMode or str, optional): How to use the on-disk response cache. Defaults to CacheMode.DISABLED.
+            cache_dir (str, optional): The directory holding cached responses. Defaults to 'cache'.
+            dtype_backend (str, optional): 'pyarrow' to return DataFrames with pyarrow-backed column types.
+                Defaults to None, which keeps the NumPy column types.
         """
         self.start_date = start_date if start_date else '2024-04-01'
         self.end_date = end_date if end_date else '2024-04-30'
+        self.cache_mode = CacheMode(cache_mode)
+        self.cache_dir = cache_dir
+        if dtype_backend not in (None, 'pyarrow'):
+            raise ValueError(
+                f"dtype_backend must be None or 'pyarrow', got {dtype_backend!r}")
+        if dtype_backend == 'pyarrow' and pa is None:
+            raise ImportError("pyarrow is required for dtype_backend='pyarrow'")
+        self.dtype_backend = dtype_backend
 
     def dimension_parameters(self, dimension_lst: List[str]) -> List[str]:
         """
@@ -87,7 +209,7 @@ class GetGA4Data():
                      for metric in self.metric_parameters(metric_lst)],
             date_ranges=[
                 DateRange(start_date=self.start_date, end_date=self.end_date)],
-            limit=100000,
+            limit=self.page_limit,
         )
         return request
 
@@ -104,39 +226,264 @@ class GetGA4Data():
         Returns:
             List[str]: The list of parameters. e.g. Output: ['date', 'userGender', 'userAgeBracket']        
         """
-        if name in config:
-            value = [data[params]
-                     for data in config[name] if params in data.keys()]
-        return value[0]
+        return self.index_config({name: config[name]})[name][params]
 
-    def run_report_batch(self, client: BetaAnalyticsDataClient, property_id: int, config: Dict[str, Any]) -> BatchRunReportsRequest:
+    def index_config(self, config: Dict[str, Any]) -> Dict[str, Dict[str, List[str]]]:
         """
-        Runs a batch report request.
+        Flattens the configuration into a lookup of parameters per configuration name.
 
         Args:
-            client (BetaAnalyticsDataClient): The Analytics Data API client.
-            property_id (int): The GA4 property ID.
             config (Dict[str, Any]): The configuration dictionary.
 
         Returns:
-            BatchRunReportsRequest: The response from the batch run reports request.
+            Dict[str, Dict[str, List[str]]]: The parameters of each configuration.
+            e.g. Output: {'active_usr': {'dimension': ['date'], 'metric': ['active1DayUsers']}}
+        """
+        return {name: {params: value for data in entries for params, value in data.items()}
+                for name, entries in config.items()}
+
+    def dedupe_config(self, config: Dict[str, Any], index: Dict[str, Dict[str, List[str]]] = None) -> Dict[str, List[str]]:
         """
+        Groups the configuration names that request the same dimensions and metrics.
+
+        Args:
+            config (Dict[str, Any]): The configuration dictionary.
+            index (Dict[str, Dict[str, List[str]]], optional): The configuration index from index_config.
+                Built from config when not given.
+
+        Returns:
+            Dict[str, List[str]]: The first name of each group mapped to every name in the group, in config order.
+            e.g. Output: {'active_usr': ['active_usr', 'active_usr_panel']}
+        """
+        if index is None:
+            index = self.index_config(config)
+        first_name = {}
+        aliases = {}
+        for name in config:
+            key = (tuple(sorted(index[name]["dimension"])),
+                   tuple(sorted(index[name]["metric"])))
+            aliases.setdefault(first_name.setdefault(key, name), []).append(name)
+        return aliases
+
+    def build_request_lst(self, config: Dict[str, Any], index: Dict[str, Dict[str, List[str]]] = None) -> List[RunReportRequest]:
+        """
+        Builds one RunReportRequest per configuration, in config order.
+
+        Args:
+            config (Dict[str, Any]): The configuration dictionary.
+            index (Dict[str, Dict[str, List[str]]], optional): The configuration index from index_config.
+                Built from config when not given.
+
+        Returns:
+            List[RunReportRequest]: The list of report requests.
+        """
+        if index is None:
+            index = self.index_config(config)
         request_lst = []
         for name in list(config.keys()):
             request_lst.append(RunReportRequest(self.request_parameters(
-                dimension_lst=self.parse_input(config, name, "dimension"),
-                metric_lst=self.parse_input(config, name, "metric")
+                dimension_lst=index[name]["dimension"],
+                metric_lst=index[name]["metric"]
             )))
             self.reset_parameters()
+        return request_lst
 
+    def run_report_batch(self, client: BetaAnalyticsDataClient, property_id: int, config: Dict[str, Any],
+                         index: Dict[str, Dict[str, List[str]]] = None) -> BatchRunReportsRequest:
+        """
+        Runs a batch report request.
+
+        Args:
+            client (BetaAnalyticsDataClient): The Analytics Data API client.
+            property_id (int): The GA4 property ID.
+            config (Dict[str, Any]): The configuration dictionary.
+            index (Dict[str, Dict[str, List[str]]], optional): The configuration index from index_config.
+                Built from config when not given.
+
+        Returns:
+            BatchRunReportsRequest: The response from the batch run reports request.
+        """
         requests = BatchRunReportsRequest(
             property=f"properties/{property_id}",
-            requests=request_lst
+            requests=self.build_request_lst(config, index)
         )
         response = client.batch_run_reports(requests)
         return response
 
-    def generate_batch_report(self, client: BetaAnalyticsDataClient, property_id: int, config: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+    async def run_report_batch_async(self, property_id: int, config: Dict[str, Any],
+                                     async_client: BetaAnalyticsDataAsyncClient = None,
+                                     index: Dict[str, Dict[str, List[str]]] = None) -> List[RunReportResponse]:
+        """
+        Runs every report of the configuration concurrently with the async client.
+
+        Args:
+            property_id (int): The GA4 property ID.
+            config (Dict[str, Any]): The configuration dictionary.
+            async_client (BetaAnalyticsDataAsyncClient, optional): The async Analytics Data API client.
+                Defaults to a new client from create_async_client, closed before returning.
+            index (Dict[str, Dict[str, List[str]]], optional): The configuration index from index_config.
+                Built from config when not given.
+
+        Returns:
+            List[RunReportResponse]: The report responses, in config order.
+        """
+        if async_client is None:
+            async_client = create_async_client()
+            try:
+                return await self.run_report_batch_async(property_id, config, async_client, index)
+            finally:
+                await async_client.transport.close()
+
+        request_lst = self.build_request_lst(config, index)
+        for request in request_lst:
+            request.property = f"properties/{property_id}"
+        # gather returns results in submission order, so they still line up with config
+        reports = await asyncio.gather(
+            *(async_client.run_report(request) for request in request_lst))
+        return list(reports)
+
+    @cache_response
+    def fetch_reports(self, client: BetaAnalyticsDataClient, property_id: int, config: Dict[str, Any],
+                      concurrent: bool = False, index: Dict[str, Dict[str, List[str]]] = None) -> List[RunReportResponse]:
+        """
+        Fetches the reports of every configuration, going through the response cache.
+
+        Args:
+            client (BetaAnalyticsDataClient): The Analytics Data API client.
+            property_id (int): The GA4 property ID.
+            config (Dict[str, Any]): The configuration dictionary.
+            concurrent (bool, optional): Run the reports concurrently with the async client
+                instead of a single batch request. Defaults to False.
+            index (Dict[str, Dict[str, List[str]]], optional): The configuration index from index_config.
+                Built from config when not given.
+
+        Returns:
+            List[RunReportResponse]: The report responses, in config order.
+        """
+        if index is None:
+            index = self.index_config(config)
+        if concurrent:
+            return asyncio.run(self.fetch_reports_async(property_id, config, index))
+
+        reports = list(self.run_report_batch(
+            client, property_id, config, index).reports)
+        self.fetch_remaining_pages(
+            client, property_id, self.truncated_reports(reports, config, index))
+        return reports
+
+    async def fetch_reports_async(self, property_id: int, config: Dict[str, Any],
+                                  index: Dict[str, Dict[str, List[str]]] = None) -> List[RunReportResponse]:
+        """
+        Runs the reports concurrently and fetches their missing pages, all through one async client.
+
+        Args:
+            property_id (int): The GA4 property ID.
+            config (Dict[str, Any]): The configuration dictionary.
+            index (Dict[str, Dict[str, List[str]]], optional): The configuration index from index_config.
+                Built from config when not given.
+
+        Returns:
+            List[RunReportResponse]: The complete report responses, in config order.
+        """
+        if index is None:
+            index = self.index_config(config)
+        async_client = create_async_client()
+        try:
+            reports = await self.run_report_batch_async(
+                property_id, config, async_client, index)
+            await self.fetch_remaining_pages_async(
+                property_id, self.truncated_reports(reports, config, index), async_client)
+        finally:
+            await async_client.transport.close()
+        return reports
+
+    def truncated_reports(self, reports: List[RunReportResponse], config: Dict[str, Any],
+                          index: Dict[str, Dict[str, List[str]]]) -> List[Any]:
+        """
+        Finds the reports larger than page_limit, which only returned their first page.
+
+        Args:
+            reports (List[RunReportResponse]): The report responses, in config order.
+            config (Dict[str, Any]): The configuration dictionary.
+            index (Dict[str, Dict[str, List[str]]]): The configuration index from index_config.
+
+        Returns:
+            List[Any]: (RunReportRequest, RunReportResponse) pairs of the truncated reports.
+        """
+        truncated = []
+        for name, report in zip(config.keys(), reports):
+            if report.row_count > len(report.rows):
+                # requests are only rebuilt for the reports that need more pages
+                request = self.request_parameters(
+                    index[name]["dimension"], index[name]["metric"])
+                self.reset_parameters()
+                truncated.append((request, report))
+        return truncated
+
+    def page_requests(self, property_id: int, request: RunReportRequest,
+                      report: RunReportResponse) -> List[RunReportRequest]:
+        """
+        Builds the requests of the pages missing from a truncated report.
+
+        Args:
+            property_id (int): The GA4 property ID.
+            request (RunReportRequest): The request of the report.
+            report (RunReportResponse): The truncated report response.
+
+        Returns:
+            List[RunReportRequest]: One request per missing page, in offset order.
+        """
+        page_lst = []
+        for offset in range(len(report.rows), report.row_count, self.page_limit):
+            page_request = RunReportRequest(request)
+            page_request.property = f"properties/{property_id}"
+            page_request.offset = offset
+            page_lst.append(page_request)
+        return page_lst
+
+    def fetch_remaining_pages(self, client: BetaAnalyticsDataClient, property_id: int, truncated: List[Any]) -> None:
+        """
+        Fetches the pages beyond the first one of truncated reports and appends their rows.
+
+        Args:
+            client (BetaAnalyticsDataClient): The Analytics Data API client.
+            property_id (int): The GA4 property ID.
+            truncated (List[Any]): (RunReportRequest, RunReportResponse) pairs from truncated_reports.
+        """
+        for request, report in truncated:
+            for page_request in self.page_requests(property_id, request, report):
+                report.rows.extend(client.run_report(page_request).rows)
+
+    async def fetch_remaining_pages_async(self, property_id: int, truncated: List[Any],
+                                          async_client: BetaAnalyticsDataAsyncClient) -> None:
+        """
+        Fetches the pages beyond the first one of truncated reports and appends their rows.
+
+        All missing pages are known from row_count, so they are requested concurrently,
+        at most max_concurrent_pages at a time.
+
+        Args:
+            property_id (int): The GA4 property ID.
+            truncated (List[Any]): (RunReportRequest, RunReportResponse) pairs from truncated_reports.
+            async_client (BetaAnalyticsDataAsyncClient): The async Analytics Data API client.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_pages)
+
+        async def fetch_page(page_request: RunReportRequest) -> RunReportResponse:
+            async with semaphore:
+                return await async_client.run_report(page_request)
+
+        async def fetch_report(request: RunReportRequest, report: RunReportResponse) -> None:
+            # gather keeps the pages in offset order
+            pages = await asyncio.gather(
+                *(fetch_page(page_request) for page_request in self.page_requests(property_id, request, report)))
+            for page in pages:
+                report.rows.extend(page.rows)
+
+        await asyncio.gather(*(fetch_report(request, report) for request, report in truncated))
+
+    def generate_batch_report(self, client: BetaAnalyticsDataClient, property_id: int, config: Dict[str, Any],
+                              concurrent: bool = False) -> Dict[str, pd.DataFrame]:
         """
         Generates a batch report.
 
@@ -144,43 +491,228 @@ class GetGA4Data():
             client (BetaAnalyticsDataClient): The Analytics Data API client.
             property_id (int): The GA4 property ID.
             config (Dict[str, Any]): The configuration dictionary.
+            concurrent (bool, optional): Run the reports concurrently with the async client
+                instead of a single batch request. Defaults to False.
 
         Returns:
             Dict[str, pd.DataFrame]: A dictionary of DataFrames with the report data.
         """
-        # for better dealing with dict type
-        report_data = defaultdict(list)
-        response = self.run_report_batch(client, property_id, config)
-        # list config name
-        config_name_lst = list(config.keys())
-        # retrieve config name by order
-        config_count = 0
+        return self.generate_reports(client, property_id, config, concurrent,
+                                     self.process_report, self.alias_dataframe)
+
+    def generate_reports(self, client: BetaAnalyticsDataClient, property_id: int, config: Dict[str, Any],
+                         concurrent: bool, process_report: Callable, alias_report: Callable) -> Dict[str, Any]:
+        """
+        Fetches every distinct request of the configuration once and builds the output of each config name.
+
+        Args:
+            client (BetaAnalyticsDataClient): The Analytics Data API client.
+            property_id (int): The GA4 property ID.
+            config (Dict[str, Any]): The configuration dictionary.
+            concurrent (bool): Run the reports concurrently with the async client
+                instead of a single batch request.
+            process_report (Callable): Builds the output of a fetched report, called as
+                process_report(report, name, index).
+            alias_report (Callable): Builds the output of a config name whose request is identical
+                to an already fetched one, called as alias_report(output, alias, index).
+
+        Returns:
+            Dict[str, Any]: The output of every config name, in config order.
+        """
+        # parameters of every config name, looked up from here on instead of re-parsing config
+        index = self.index_config(config)
+        aliases = self.dedupe_config(config, index)
+        # identical requests are only fetched once, for the first config name requesting them
+        unique_config = {name: config[name] for name in aliases}
+        reports = self.fetch_reports(
+            client, property_id, unique_config, concurrent=concurrent, index=index)
         # final output
         result_dict = {}
 
-        for report in response.reports:
-            # get all batch report
-            for row in report.rows:
-                # config name: config_name_lst[config_count]
-                dimensions = self.parse_input(
-                    config, config_name_lst[config_count], "dimension")
-                metrics = self.parse_input(
-                    config, config_name_lst[config_count], "metric")
-
-                # dimensions
-                for idx, key in enumerate(dimensions):
-                    report_data[key].append(row.dimension_values[idx].value)
-                # metrics
-                for idx, key in enumerate(metrics):
-                    report_data[key].append(row.metric_values[idx].value)
-
-            result_dict[config_name_lst[config_count]
-                        ] = self.create_dataframe(report_data)
-            # reset value of report_data
-            report_data = defaultdict(list)
-            # next config name
-            config_count += 1
-        return result_dict
+        # reports come back in config order, so pair each one with its config name
+        for name, report in zip(unique_config.keys(), reports):
+            output = process_report(report, name, index)
+            for alias in aliases[name]:
+                result_dict[alias] = output if alias == name else alias_report(
+                    output, alias, index)
+        return {name: result_dict[name] for name in config}
+
+    def process_report(self, report: RunReportResponse, name: str,
+                       index: Dict[str, Dict[str, List[str]]]) -> pd.DataFrame:
+        """
+        Turns a single report response into its final DataFrame.
+
+        Args:
+            report (RunReportResponse): The report response.
+            name (str): The name of the configuration the report belongs to.
+            index (Dict[str, Dict[str, List[str]]]): The configuration index from index_config.
+
+        Returns:
+            pd.DataFrame: The resulting DataFrame.
+        """
+        return self.create_dataframe(self.parse_report(
+            report, index[name]["dimension"], index[name]["metric"]))
+
+    def alias_dataframe(self, df: pd.DataFrame, name: str, index: Dict[str, Dict[str, List[str]]]) -> pd.DataFrame:
+        """
+        Builds the DataFrame of a config name from the DataFrame of an identical request.
+
+        Args:
+            df (pd.DataFrame): The DataFrame of the identical request.
+            name (str): The name of the configuration.
+            index (Dict[str, Dict[str, List[str]]]): The configuration index from index_config.
+
+        Returns:
+            pd.DataFrame: The data columns in the configuration's own order, with new uuid and emitted_at values.
+        """
+        df = self.add_insert_info(
+            df[index[name]["dimension"] + index[name]["metric"]].copy())
+        if self.dtype_backend == 'pyarrow':
+            df = self.change_arrow_type(df)
+        return df
+
+    def generate_batch_report_arrow(self, client: BetaAnalyticsDataClient, property_id: int, config: Dict[str, Any],
+                                    concurrent: bool = False) -> Dict[str, "pa.Table"]:
+        """
+        Generates a batch report as Arrow tables, skipping the pandas materialization.
+
+        Dimensions are dictionary-encoded, 'date' becomes timestamp[ns] and metrics keep
+        their numeric types. Use table.to_pandas(self_destruct=True) where pandas is needed.
+
+        Args:
+            client (BetaAnalyticsDataClient): The Analytics Data API client.
+            property_id (int): The GA4 property ID.
+            config (Dict[str, Any]): The configuration dictionary.
+            concurrent (bool, optional): Run the reports concurrently with the async client
+                instead of a single batch request. Defaults to False.
+
+        Returns:
+            Dict[str, pa.Table]: A dictionary of Arrow tables with the report data.
+        """
+        if pa is None:
+            raise ImportError(
+                "pyarrow is required for generate_batch_report_arrow")
+
+        return self.generate_reports(client, property_id, config, concurrent,
+                                     self.process_report_arrow, self.alias_table)
+
+    def process_report_arrow(self, report: RunReportResponse, name: str,
+                             index: Dict[str, Dict[str, List[str]]]) -> "pa.Table":
+        """
+        Turns a single report response into its final Arrow table.
+
+        Args:
+            report (RunReportResponse): The report response.
+            name (str): The name of the configuration the report belongs to.
+            index (Dict[str, Dict[str, List[str]]]): The configuration index from index_config.
+
+        Returns:
+            pa.Table: The resulting Arrow table.
+        """
+        dimensions = index[name]["dimension"]
+        report_data = self.parse_report(
+            report, dimensions, index[name]["metric"])
+        columns = {}
+        for key, arr in report_data.items():
+            if key == 'date':
+                columns[key] = pc.strptime(
+                    pa.array(arr, type=pa.string()), format='%Y%m%d', unit='ns')
+            elif key in dimensions:
+                columns[key] = pa.array(
+                    arr, type=pa.dictionary(pa.int32(), pa.string()))
+            else:
+                columns[key] = pa.array(arr)
+        return self.add_insert_info_arrow(pa.table(columns))
+
+    def alias_table(self, table: "pa.Table", name: str, index: Dict[str, Dict[str, List[str]]]) -> "pa.Table":
+        """
+        Builds the Arrow table of a config name from the table of an identical request.
+
+        Args:
+            table (pa.Table): The Arrow table of the identical request.
+            name (str): The name of the configuration.
+            index (Dict[str, Dict[str, List[str]]]): The configuration index from index_config.
+
+        Returns:
+            pa.Table: The data columns in the configuration's own order, with new uuid and emitted_at values.
+        """
+        # select shares the data buffers; only the insert info is generated again
+        return self.add_insert_info_arrow(
+            table.select(index[name]["dimension"] + index[name]["metric"]))
+
+    def add_insert_info_arrow(self, table: "pa.Table") -> "pa.Table":
+        """
+        Adds UUID and timestamp columns to the Arrow table.
+
+        Args:
+            table (pa.Table): The input Arrow table.
+
+        Returns:
+            pa.Table: The Arrow table with added UUID and timestamp columns.
+        """
+        n = table.num_rows
+        table = table.append_column(
+            'uuid', pa.array(self.generate_uuids(n), type=pa.string()))
+        return table.append_column(
+            'emitted_at', pa.array(np.full(n, np.datetime64(datetime.now(), 'ns'))))
+
+    def parse_report(self, report: RunReportResponse, dimensions: List[str], metrics: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Extracts the dimension and metric columns of a report.
+
+        Args:
+            report (RunReportResponse): The report response.
+            dimensions (List[str]): The dimension names of the report.
+            metrics (List[str]): The metric names of the report.
+
+        Returns:
+            Dict[str, np.ndarray]: One array per dimension (object) and metric (numeric).
+        """
+        # fill pre-allocated dimension arrays in a single pass over the rows
+        rows = report.rows
+        n = len(rows)
+        dimension_arrs = {key: np.empty(n, dtype=object) for key in dimensions}
+        # one intern table per dimension, so repeated values share a single str object
+        interns = {key: {} for key in dimensions}
+        for i, row in enumerate(rows):
+            for key, value in zip(dimensions, row.dimension_values):
+                value = value.value
+                dimension_arrs[key][i] = interns[key].setdefault(value, value)
+        # parse metric strings straight into the numeric dtype given by the metric header
+        metric_arrs = {key: np.fromiter((row.metric_values[idx].value for row in rows),
+                                        dtype=self.metric_dtype(header), count=n)
+                       for idx, (key, header) in enumerate(zip(metrics, report.metric_headers))}
+        return {**dimension_arrs, **metric_arrs}
+
+    def metric_dtype(self, header: MetricHeader) -> str:
+        """
+        Returns the NumPy dtype of a metric from the type reported by GA4.
+
+        Args:
+            header (MetricHeader): The metric header of the report.
+
+        Returns:
+            str: 'int64' for integer metrics, 'float64' for every other type.
+        """
+        return 'int64' if header.type_ == MetricType.TYPE_INTEGER else 'float64'
+
+    def generate_uuids(self, n: int) -> List[str]:
+        """
+        Generates n random version 4 UUIDs as 32-character hex strings.
+
+        Args:
+            n (int): The number of UUIDs.
+
+        Returns:
+            List[str]: The UUID hex strings.
+        """
+        # draw all random bytes with a single os.urandom call, one 16-byte row per uuid
+        raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+        # set the version 4 and RFC 4122 variant bits, as uuid.uuid4() does
+        raw[:, 6] = (raw[:, 6] & 0x0f) | 0x40
+        raw[:, 8] = (raw[:, 8] & 0x3f) | 0x80
+        hexed = binascii.hexlify(raw.tobytes()).decode()
+        return [hexed[i * 32:(i + 1) * 32] for i in range(n)]
 
     def add_insert_info(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -192,32 +724,26 @@ class GetGA4Data():
         Returns:
             pd.DataFrame: The DataFrame with added UUID and timestamp columns.
         """
-        df['uuid'] = [uuid.uuid4().hex for _ in range(len(df.index))]
-        df['emitted_at'] = datetime.now()
+        # explicit dtype so an empty report does not get a float64 uuid column
+        df['uuid'] = pd.Series(self.generate_uuids(len(df.index)), index=df.index, dtype=object)
+        # a datetime64[ns] scalar broadcasts into a typed column without per-cell conversion
+        df['emitted_at'] = np.datetime64(datetime.now(), 'ns')
         return df
 
-    def change_col_type(self, df: pd.DataFrame) -> None:
+    def change_col_type(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Changes the column types of the DataFrame.
 
         Args:
             df (pd.DataFrame): The input DataFrame.
+
+        Returns:
+            pd.DataFrame: The DataFrame with the converted column types.
         """
-        # Dictionary mapping column names to their desired types
-        column_types = {
-            'activeUsers': 'int64',
-            'active1DayUsers': 'int64',
-            'active7DayUsers': 'int64',
-            'active28DayUsers': 'int64',
-            'userEngagementDuration': 'float64',
-            'engagedSessions': 'int64',
-            'sessions': 'int64'
-        }
-
-        # Loop through the dictionary and change column types if the column exists in the DataFrame
-        for column, dtype in column_types.items():
-            if column in df.columns:
-                df[column] = df[column].astype(dtype)
+        # Change the types of the columns that exist in the DataFrame in a single astype call
+        applicable = {column: dtype for column, dtype in self.column_types.items()
+                      if column in df.columns}
+        return df.astype(applicable)
 
     def change_date_type(self, df: pd.DataFrame) -> None:
         """
@@ -226,26 +752,53 @@ class GetGA4Data():
         Args:
             df (pd.DataFrame): The input DataFrame.
         """
-        df['date'] = pd.to_datetime(df['date'])
-        df['date'] = df['date'].apply(
-            lambda x: datetime(x.year, x.month, x.day))
+        # GA4 returns dates as YYYYMMDD; an explicit format skips format inference
+        # pin the resolution, which pandas otherwise picks from the data (e.g. seconds when empty)
+        df['date'] = pd.to_datetime(
+            df['date'], format='%Y%m%d').dt.normalize().astype('datetime64[ns]')
 
-    def create_dataframe(self, data: Dict[str, List[str]]) -> pd.DataFrame:
+    def create_dataframe(self, data: Dict[str, np.ndarray]) -> pd.DataFrame:
         """
         Creates a DataFrame from the given data and applies necessary transformations.
 
         Args:
-            data (Dict[str, List[str]]): The input data dictionary.
+            data (Dict[str, np.ndarray]): The input data dictionary.
 
         Returns:
             pd.DataFrame: The resulting DataFrame.
         """
         df = pd.DataFrame(data)
-        self.change_col_type(df)
+        df = self.change_col_type(df)
         self.change_date_type(df)
         df = self.add_insert_info(df)
+        if self.dtype_backend == 'pyarrow':
+            df = self.change_arrow_type(df)
         return df
 
+    def change_arrow_type(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Switches the columns of the DataFrame to the pyarrow equivalent of their current type.
+
+        Types are mapped, not inferred from the data, so the schema does not depend on the
+        values of a given run. Categorical columns are kept as they are.
+
+        Args:
+            df (pd.DataFrame): The input DataFrame.
+
+        Returns:
+            pd.DataFrame: The DataFrame with pyarrow-backed column types.
+        """
+        arrow_types = {}
+        for column, dtype in df.dtypes.items():
+            if isinstance(dtype, (pd.CategoricalDtype, pd.ArrowDtype)):
+                continue
+            # uuid is listed explicitly: an empty report gives it no string values to go by
+            if column == 'uuid' or pd.api.types.is_string_dtype(dtype):
+                arrow_types[column] = 'string[pyarrow]'
+            else:
+                arrow_types[column] = pd.ArrowDtype(pa.from_numpy_dtype(dtype))
+        return df.astype(arrow_types)
+
 
 if __name__ == '__main__':
     config = {"signal_data": [